@@ -1,10 +1,12 @@
+from weakref import WeakValueDictionary
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity_registry
 from homeassistant.helpers.storage import Store
 
-from .const import ACTION_TIMEOUT_DEFAULT, DOMAIN, STORE_VERSION
+from .const import ACTION_TIMEOUT_DEFAULT, CALL_INTERVAL_DEFAULT, DOMAIN, STORE_VERSION
 from .scene_manager import ResSceneManager
 
 PLATFORMS = ["scene", "select"]
@@ -25,13 +27,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     stored_data = await store.async_load() or {}
 
     # make DOMAIN key
-    hass.data.setdefault(DOMAIN, {"entities": {}})
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    # entity_id -> ResSceneEntity; weak so removed entities never linger here
+    domain_data.setdefault("entities", WeakValueDictionary())
 
     # initialize manager
-    if "manager" not in hass.data[DOMAIN]:
-        hass.data[DOMAIN]["manager"] = ResSceneManager(hass, store, stored_data)
+    if "manager" not in domain_data:
+        domain_data["manager"] = ResSceneManager(hass, store, stored_data)
 
-    manager: ResSceneManager = hass.data[DOMAIN]["manager"]
+    manager: ResSceneManager = domain_data["manager"]
 
     manager.set_user_options(
         {
@@ -41,6 +45,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
             "action_timeout": entry.options.get(
                 "action_timeout", ACTION_TIMEOUT_DEFAULT
             ),
+            "call_interval": entry.options.get("call_interval", CALL_INTERVAL_DEFAULT),
         }
     )
 
@@ -49,6 +54,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     # Restore saved scene
     await manager.restore_scenes()
 
+    # Option keys accepted by the create service (fixed for this entry)
+    option_keys = tuple(manager.get_user_options())
+
     # regist service
     async def save_scene(call):
         """
@@ -76,35 +84,43 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
             )
 
         # Collect snapshot entities (initial list)
-        snapshot_entities = set(call.data.get("snapshot_entities") or [])
+        parts = [call.data.get("snapshot_entities") or []]
 
         # Get entity registry
         ent_reg = entity_registry.async_get(hass)
 
         # Expand entities from areas
         snapshot_areas = call.data.get("snapshot_areas") or []
-        for area_id in snapshot_areas:
-            area_entries = entity_registry.async_entries_for_area(ent_reg, area_id)
-            snapshot_entities.update(
-                area_entry.entity_id for area_entry in area_entries
-            )
+        parts.extend(
+            [
+                area_entry.entity_id
+                for area_entry in entity_registry.async_entries_for_area(
+                    ent_reg, area_id
+                )
+            ]
+            for area_id in snapshot_areas
+        )
 
         # Expand entities from labels
         snapshot_labels = call.data.get("snapshot_labels") or []
-        all_entities = ent_reg.entities.values()
-        for label_id in snapshot_labels:
-            label_entities = [
+        parts.extend(
+            [
                 label_entry.entity_id
-                for label_entry in all_entities
-                if label_id in getattr(label_entry, "labels", set())
+                for label_entry in entity_registry.async_entries_for_label(
+                    ent_reg, label_id
+                )
             ]
-            snapshot_entities.update(label_entities)
-        # Filter out non-existing entities
-        states = hass.states
+            for label_id in snapshot_labels
+        )
+
+        # Merge everything in one pass
+        snapshot_entities = set().union(*parts)
+
+        # Filter out non-existing entities; a lookup per id stays cheaper than
+        # listing every entity of the instance
+        get_state = hass.states.get
         snapshot_entities = {
-            entity_id
-            for entity_id in snapshot_entities
-            if states.get(entity_id) is not None
+            eid for eid in snapshot_entities if get_state(eid) is not None
         }
 
         # If no valid entities remain, raise an error
@@ -116,39 +132,46 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
             )
 
         # Build options dictionary using user options defaults
-        options = {
-            key: call.data.get(key, default)
-            for key, default in manager.get_user_options().items()
-        }
+        defaults = manager.get_user_options()
+        options = {key: call.data.get(key, defaults[key]) for key in option_keys}
 
         # Save scene
-        await manager.save_scene(scene_id, list(snapshot_entities), options)
+        await manager.save_scene(scene_id, snapshot_entities, options)
 
-    async def delete_scene(call):
+    def resolve_scene_id(call) -> str | None:
         """
-        Delete the scene associated with the provided scene entity, if one exists.
+        Resolve the target scene of a service call.
 
-        Parameters:
-            call (ServiceCall): Service call data containing the "entity_id" of the scene entity to delete. If "entity_id" is missing or the entity is not associated with a stored scene, the function does nothing.
+        Returns:
+            The "scene_id" from the call data when given, otherwise the scene of the "entity_id" scene entity, or None if neither resolves.
         """
+        if scene_id := call.data.get("scene_id"):
+            return scene_id
         entity_id = call.data.get("entity_id")
         if entity_id:
             if entity := hass.data[DOMAIN]["entities"].get(entity_id):
-                scene_id = entity._scene_id
-                await manager.delete_scene(scene_id)
+                return entity._scene_id
+        return None
+
+    async def delete_scene(call):
+        """
+        Delete the scene identified by "scene_id" or by the provided scene entity, if one exists.
+
+        Parameters:
+            call (ServiceCall): Service call data containing either the "scene_id" or the "entity_id" of the scene entity to delete. If neither resolves to a stored scene, the function does nothing.
+        """
+        if scene_id := resolve_scene_id(call):
+            await manager.delete_scene(scene_id)
 
     async def apply_scene(call):
         """
-        Apply the scene associated with the provided scene entity.
+        Apply the scene identified by "scene_id" or by the provided scene entity.
 
         Parameters:
-            call (ServiceCall): Service call data containing the "entity_id" of the scene entity to apply.
+            call (ServiceCall): Service call data containing either the "scene_id" or the "entity_id" of the scene entity to apply.
         """
-        entity_id = call.data.get("entity_id")
-        if entity_id:
-            if entity := hass.data[DOMAIN]["entities"].get(entity_id):
-                scene_id = entity._scene_id
-                await manager.apply_scene(scene_id)
+        if scene_id := resolve_scene_id(call):
+            await manager.apply_scene(scene_id)
 
     hass.services.async_register(DOMAIN, "create", save_scene)
     hass.services.async_register(DOMAIN, "delete", delete_scene)
@@ -169,5 +192,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     if unload_ok:
         domain_data = hass.data.get(DOMAIN)
         if domain_data is not None:
-            domain_data.pop("manager", None)
+            manager = domain_data.pop("manager", None)
+            if manager is not None:
+                await manager.async_flush()
     return unload_ok
@@ -1,3 +1,10 @@
 DOMAIN = "res_scene"
 STORE_VERSION = 1
 ACTION_TIMEOUT_DEFAULT = 20
+CALL_INTERVAL_DEFAULT = 0
+
+# Dispatcher signals
+# SIGNAL_SCENE_ADDED carries None after a bulk restore of all stored scenes
+SIGNAL_SCENE_ADDED = f"{DOMAIN}_scene_added"
+SIGNAL_SCENE_REMOVED = f"{DOMAIN}_scene_removed"
+SIGNAL_SCENE_RENAMED = f"{DOMAIN}_scene_renamed"
@@ -1,19 +1,40 @@
 import datetime
 
+import orjson
 
-def to_json_safe(value):
-    """Convert any Python object into a JSON-serializable structure."""
-    if isinstance(value, (str, int, float, bool)) or value is None:
+
+def _json_default(value):
+    """Fallback for objects orjson cannot serialize natively."""
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="replace")
+
+    # Home Assistant objects → 文字列化
+    return str(value)
+
+
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+# orjson only encodes integers that fit in 64 bits (signed or unsigned)
+_INT_MIN = -(2**63)
+_INT_MAX = 2**64 - 1
+
+
+def _walk_json_safe(value):
+    """Convert value recursively; used for what orjson refuses to encode."""
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value if _INT_MIN <= value <= _INT_MAX else str(value)
+
+    if isinstance(value, (str, float, bool)) or value is None:
         return value
 
-    if isinstance(value, (list, tuple)):
-        return [to_json_safe(v) for v in value]
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_walk_json_safe(v) for v in value]
 
     if isinstance(value, dict):
-        return {str(k): to_json_safe(v) for k, v in value.items()}
-
-    if isinstance(value, set):
-        return [to_json_safe(v) for v in value]
+        return {str(k): _walk_json_safe(v) for k, v in value.items()}
 
     if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
         return value.isoformat()
@@ -22,8 +43,29 @@ def to_json_safe(value):
         return value.decode("utf-8", errors="replace")
 
     # Home Assistant objects → 文字列化
-    if hasattr(value, "__class__"):
-        return str(value)
-
-    # fallback
     return str(value)
+
+
+def to_json_safe(value):
+    """Convert any Python object into a new JSON-serializable structure."""
+    # Immutable JSON scalars are returned as they are; containers are always
+    # rebuilt in one orjson pass, which is cheaper than scanning them first
+    if type(value) in _JSON_SCALARS:
+        return value
+
+    try:
+        return orjson.loads(
+            orjson.dumps(value, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+        )
+    except orjson.JSONEncodeError:
+        # e.g. tuple dict keys or integers beyond 64 bits
+        return _walk_json_safe(value)
+
+
+def to_pretty_json(value) -> str:
+    """Serialize any Python object as indented JSON text."""
+    option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    try:
+        return orjson.dumps(value, default=_json_default, option=option).decode()
+    except orjson.JSONEncodeError:
+        return orjson.dumps(_walk_json_safe(value), option=option).decode()
@@ -2,9 +2,8 @@ import logging
 
 import voluptuous as vol
 from homeassistant import config_entries
-from homeassistant.helpers.dispatcher import async_dispatcher_send
 
-from .const import ACTION_TIMEOUT_DEFAULT, DOMAIN
+from .const import ACTION_TIMEOUT_DEFAULT, CALL_INTERVAL_DEFAULT, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -17,17 +16,18 @@ class ResSceneOptionsFlow(config_entries.OptionsFlow):
         When no input is provided, presents a form allowing the user to:
         - Toggle whether light attributes are restored.
         - Set the action timeout.
+        - Set the pause between service calls to the same entity.
         - Select a scene to delete.
         - Select a scene to rename and provide the new name.
 
         When submitted, will:
         - Delete the selected scene if requested.
         - Rename a scene when both a source and a non-empty target name are provided; if the target name already exists (and is different), record a form error and do not perform the rename.
-        - Persist storage after a successful rename and dispatch signals indicating scene removal and addition.
+        - Dispatch a signal indicating the scene was renamed, then persist storage once for all changes.
 
         Parameters:
             user_input (dict | None): Form data submitted by the user, or None when displaying the form. Expected keys include
-                "restore_light_attributes", "action_timeout", optionally "delete_scene", "rename_from", and "rename_to".
+                "restore_light_attributes", "action_timeout", "call_interval", optionally "delete_scene", "rename_from", and "rename_to".
 
         Returns:
             The flow result directing Home Assistant to either show the form (with any validation errors) or create the updated options entry.
@@ -36,36 +36,45 @@ class ResSceneOptionsFlow(config_entries.OptionsFlow):
         manager = hass.data[DOMAIN]["manager"]
         errors = {}
 
-        restore_light_attributes = self.config_entry.options.get(
-            "restore_light_attributes", False
-        )
-        action_timeout = self.config_entry.options.get(
-            "action_timeout", ACTION_TIMEOUT_DEFAULT
-        )
-        scenes = list(manager.stored_data.keys())
-        scenes_select = sorted(scenes)
-
-        schema = vol.Schema(
-            {
-                vol.Required(
-                    "restore_light_attributes", default=restore_light_attributes
-                ): bool,
-                vol.Required("action_timeout", default=action_timeout): vol.All(
-                    float, vol.Range(min=0.5)
-                ),
-                vol.Optional("delete_scene"): vol.In(scenes_select),
-                vol.Optional("rename_from"): vol.In(scenes_select),
-                vol.Optional("rename_to", default=""): str,
-            }
-        )
+        def _build_schema():
+            """Build the options form schema; only needed when showing the form."""
+            restore_light_attributes = self.config_entry.options.get(
+                "restore_light_attributes", False
+            )
+            action_timeout = self.config_entry.options.get(
+                "action_timeout", ACTION_TIMEOUT_DEFAULT
+            )
+            call_interval = self.config_entry.options.get(
+                "call_interval", CALL_INTERVAL_DEFAULT
+            )
+            scenes_select = manager.get_sorted_scene_ids()
+
+            return vol.Schema(
+                {
+                    vol.Required(
+                        "restore_light_attributes", default=restore_light_attributes
+                    ): bool,
+                    vol.Required("action_timeout", default=action_timeout): vol.All(
+                        float, vol.Range(min=0.5)
+                    ),
+                    vol.Required("call_interval", default=call_interval): vol.All(
+                        float, vol.Range(min=0, max=10)
+                    ),
+                    vol.Optional("delete_scene"): vol.In(scenes_select),
+                    vol.Optional("rename_from"): vol.In(scenes_select),
+                    vol.Optional("rename_to", default=""): str,
+                }
+            )
 
         if user_input is not None:
             delete_id = user_input.pop("delete_scene", None)
             rename_from = user_input.pop("rename_from", None)
             rename_to = user_input.pop("rename_to", "").strip()
 
+            # Apply all changes in memory first, then write the store once
+            changed = False
             if delete_id:
-                await manager.delete_scene(delete_id)
+                changed |= manager._remove_scene_data(delete_id)
 
             if rename_from and rename_to != "":
                 if rename_from in manager.stored_data:
@@ -78,23 +87,16 @@ class ResSceneOptionsFlow(config_entries.OptionsFlow):
                         )
                         errors["rename_to"] = "rename_scene_already_exists"
                     else:
-                        manager.stored_data[rename_to] = manager.stored_data.pop(
-                            rename_from
-                        )
-                        await manager.store.async_save(manager.stored_data)
-                        # Dispatch signals for removed and added scenes
-                        async_dispatcher_send(
-                            self.hass, f"{DOMAIN}_scene_removed", rename_from
-                        )
-                        async_dispatcher_send(
-                            self.hass, f"{DOMAIN}_scene_added", rename_to
-                        )
+                        changed |= manager._rename_scene_data(rename_from, rename_to)
+
+            if changed:
+                manager.schedule_save()
 
             if errors:
                 return self.async_show_form(
-                    step_id="init", data_schema=schema, errors=errors
+                    step_id="init", data_schema=_build_schema(), errors=errors
                 )
             else:
                 return self.async_create_entry(title="", data=user_input)
 
-        return self.async_show_form(step_id="init", data_schema=schema)
+        return self.async_show_form(step_id="init", data_schema=_build_schema())
@@ -6,59 +6,94 @@ from homeassistant.components.scene import Scene
 from homeassistant.helpers import entity_registry
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
-from .const import DOMAIN
+from .const import (
+    DOMAIN,
+    SIGNAL_SCENE_ADDED,
+    SIGNAL_SCENE_REMOVED,
+    SIGNAL_SCENE_RENAMED,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
     manager = hass.data[DOMAIN]["manager"]
-    entities = [
-        ResSceneEntity(hass, manager, scene_id, data)
+    ent_reg = entity_registry.async_get(hass)
+    # scene_id -> entity, for O(1) lookups from the dispatcher handlers
+    by_scene_id: dict[str, ResSceneEntity] = {
+        scene_id: ResSceneEntity(hass, manager, scene_id, data)
         for scene_id, data in manager.stored_data.items()
-    ]
-    async_add_entities(entities)
-    for entity in entities:
+    }
+    async_add_entities(list(by_scene_id.values()))
+    for entity in by_scene_id.values():
         hass.data[DOMAIN]["entities"][entity.entity_id] = entity
 
     # realtime apply via dispatcher
     async def scene_added(scene_id):
+        # bulk restore: add every stored scene that has no entity yet
+        if scene_id is None:
+            for stored_id in list(manager.stored_data):
+                await scene_added(stored_id)
+            return
+
         # check registed
-        if any(e._scene_id == scene_id for e in entities):
+        if scene_id in by_scene_id:
             return
 
         new_entity = ResSceneEntity(
             hass, manager, scene_id, manager.stored_data.get(scene_id, {})
         )
         async_add_entities([new_entity])
-        entities.append(new_entity)
+        by_scene_id[scene_id] = new_entity
         hass.data[DOMAIN]["entities"][new_entity.entity_id] = new_entity
         _LOGGER.info("Added ResSceneEntity %s via dispatcher", scene_id)
 
     async def scene_removed(scene_id):
-        ent_reg = entity_registry.async_get(hass)
+        e = by_scene_id.pop(scene_id, None)
+        if e is None:
+            return
+
+        # 1st remove from entity_registry
+        ent_reg.async_remove(e.entity_id)
+
+        # next remove entity
+        await e.async_remove()
+
+        # Ensure entity is fully removed: remove from state machine
+        hass.states.async_remove(e.entity_id)
 
-        # copy list() for list edit
-        for e in list(entities):
-            if e._scene_id == scene_id:
-                # 1st remove from entity_registry
-                ent_reg.async_remove(e.entity_id)
+        hass.data[DOMAIN]["entities"].pop(e.entity_id, None)
 
-                # next remove entity
-                await e.async_remove()
+        _LOGGER.info("Removed ResSceneEntity %s via dispatcher", scene_id)
 
-                # Ensure entity is fully removed: remove from state machine
-                hass.states.async_remove(e.entity_id)
+    async def scene_renamed(old_id, new_id):
+        e = by_scene_id.pop(old_id, None)
+        if e is None:
+            await scene_added(new_id)
+            return
 
-                # remove local list
-                entities.remove(e)
-                hass.data[DOMAIN]["entities"].pop(e.entity_id, None)
+        # Rename in place: keep entity_id, move unique_id to the new scene
+        try:
+            ent_reg.async_update_entity(e.entity_id, new_unique_id=f"res_{new_id}")
+        except (KeyError, ValueError) as err:
+            _LOGGER.debug(
+                "Cannot rename ResSceneEntity %s in place (%s), re-creating",
+                old_id,
+                err,
+            )
+            by_scene_id[old_id] = e
+            await scene_removed(old_id)
+            await scene_added(new_id)
+            return
 
-                _LOGGER.info("Removed ResSceneEntity %s via dispatcher", scene_id)
+        e.rename(new_id, manager.stored_data.get(new_id, {}))
+        by_scene_id[new_id] = e
+        _LOGGER.info("Renamed ResSceneEntity %s to %s via dispatcher", old_id, new_id)
 
     # regist dispatcher
-    async_dispatcher_connect(hass, f"{DOMAIN}_scene_added", scene_added)
-    async_dispatcher_connect(hass, f"{DOMAIN}_scene_removed", scene_removed)
+    async_dispatcher_connect(hass, SIGNAL_SCENE_ADDED, scene_added)
+    async_dispatcher_connect(hass, SIGNAL_SCENE_REMOVED, scene_removed)
+    async_dispatcher_connect(hass, SIGNAL_SCENE_RENAMED, scene_renamed)
     return True
 
 
@@ -71,20 +106,23 @@ class ResSceneEntity(Scene):
         self._scene_id = scene_id
         self._attr_name = f"Res: {scene_id}"
         self._attr_unique_id = f"res_{scene_id}"
-        self._extra_data = data or {}
+        self._attr_extra_state_attributes = data or None
 
     @cached_property
     def icon(self):
         return "mdi:palette"
 
-    @property
-    def extra_state_attributes(self) -> dict | None:
-        """Expose extra data to Home Assistant state machine."""
-        return self._extra_data if self._extra_data else None
+    def rename(self, scene_id: str, data: dict | None = None):
+        """Point this entity at a renamed scene and push the new name."""
+        self._scene_id = scene_id
+        self._attr_name = f"Res: {scene_id}"
+        self._attr_unique_id = f"res_{scene_id}"
+        self._attr_extra_state_attributes = data or None
+        self.async_write_ha_state()
 
     def set_extra_state_attributes(self, data: dict):
         """Update extra_state_attributes dynamically."""
-        self._extra_data = data
+        self._attr_extra_state_attributes = data or None
         self.async_write_ha_state()
 
     async def async_activate(self, **kwargs: Any):
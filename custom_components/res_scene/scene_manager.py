@@ -1,7 +1,12 @@
 import asyncio
+import bisect
 import logging
-from copy import deepcopy
-from typing import Any
+from collections.abc import AsyncIterator, Iterable
+from contextlib import AsyncExitStack, asynccontextmanager
+from functools import partial
+from types import MappingProxyType
+from typing import Any, NamedTuple
+from weakref import WeakValueDictionary
 
 from homeassistant.components.climate.const import (
     ATTR_FAN_MODE,
@@ -50,34 +55,225 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
-from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HassJobType,
+    HomeAssistant,
+    State,
+    callback,
+)
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_track_state_change_event
-
-from .const import ACTION_TIMEOUT_DEFAULT, DOMAIN
+from homeassistant.util.async_ import create_eager_task
+
+from .const import (
+    ACTION_TIMEOUT_DEFAULT,
+    CALL_INTERVAL_DEFAULT,
+    DOMAIN,
+    SIGNAL_SCENE_ADDED,
+    SIGNAL_SCENE_REMOVED,
+    SIGNAL_SCENE_RENAMED,
+)
+from .helpers import to_json_safe, to_pretty_json
 
 _LOGGER = logging.getLogger(__name__)
 
 DISPATCHER_UPDATE = "res_scene_updated"
-SERVICE_CALL_DELAY = 1.0  # Delay in seconds when calling a service to the same entity
+# Seconds to coalesce scene changes before writing them to storage
+SAVE_DELAY = 1.0
+# Max seconds to wait for a state change between calls to the same entity
+SERVICE_CALL_WAIT = 2.0
 
 COLOR_MODE_ATTRS = {
-    "onoff": set(),
-    "brightness": {"brightness", "brightness_pct"},
-    "hs": {"hs_color", "brightness", "brightness_pct"},
-    "rgb": {"rgb_color", "brightness", "brightness_pct"},
-    "rgbw": {"rgbw_color", "brightness", "brightness_pct"},
-    "rgbww": {"rgbww_color", "brightness", "brightness_pct"},
-    "xy": {"xy_color", "brightness", "brightness_pct"},
-    "color_temp": {"color_temp", "color_temp_kelvin", "brightness", "brightness_pct"},
+    "onoff": frozenset(),
+    "brightness": frozenset({"brightness", "brightness_pct"}),
+    "hs": frozenset({"hs_color", "brightness", "brightness_pct"}),
+    "rgb": frozenset({"rgb_color", "brightness", "brightness_pct"}),
+    "rgbw": frozenset({"rgbw_color", "brightness", "brightness_pct"}),
+    "rgbww": frozenset({"rgbww_color", "brightness", "brightness_pct"}),
+    "xy": frozenset({"xy_color", "brightness", "brightness_pct"}),
+    "color_temp": frozenset(
+        {"color_temp", "color_temp_kelvin", "brightness", "brightness_pct"}
+    ),
 }
 
 ATTR_ATTRS = {
-    "profile": {"brightness", "brightness_pct"},
-    "white": {"brightness", "brightness_pct"},
+    "profile": frozenset({"brightness", "brightness_pct"}),
+    "white": frozenset({"brightness", "brightness_pct"}),
+}
+
+COMMON_LIGHT_ATTRS = frozenset({"effect", "flash", "white", "profile"})
+
+# Full set of attributes passed to light.turn_on, per color mode / special attr
+_COLOR_MODE_ALLOWED = {
+    mode: keys | COMMON_LIGHT_ATTRS for mode, keys in COLOR_MODE_ATTRS.items()
 }
+_ATTR_ALLOWED = {attr: keys | COMMON_LIGHT_ATTRS for attr, keys in ATTR_ATTRS.items()}
+
+# Domains whose state cannot be restored by a service call
+NON_RESTORABLE_DOMAINS = frozenset(
+    {
+        "sensor",
+        "binary_sensor",
+        "device_tracker",
+        "camera",
+        "vacuum",
+        "scene",
+        "script",
+    }
+)
+
+# Domains restored with a plain turn_on / turn_off
+SIMPLE_ONOFF_DOMAINS = frozenset(
+    {
+        "fan",
+        "humidifier",
+        "remote",
+        "siren",
+        "switch",
+        "input_boolean",
+    }
+)
+
+# media_player services whose resulting state is known in advance
+MEDIA_EXPECTED_STATES = {
+    SERVICE_TURN_OFF: STATE_OFF,
+    SERVICE_MEDIA_PLAY: STATE_PLAYING,
+    SERVICE_MEDIA_PAUSE: STATE_PAUSED,
+}
+
+# Attributes compared to decide whether an entity already matches the scene;
+# an empty set compares the state only, unlisted domains compare everything
+SALIENT_ATTRS = {
+    "light": frozenset(
+        {
+            "brightness",
+            "color_mode",
+            "color_temp_kelvin",
+            "effect",
+            "hs_color",
+            "rgb_color",
+            "rgbw_color",
+            "rgbww_color",
+            "xy_color",
+        }
+    ),
+    "climate": frozenset(
+        {
+            ATTR_TEMPERATURE,
+            ATTR_TARGET_TEMP_LOW,
+            ATTR_TARGET_TEMP_HIGH,
+            ATTR_FAN_MODE,
+            ATTR_SWING_MODE,
+            ATTR_PRESET_MODE,
+            ATTR_HUMIDITY,
+        }
+    ),
+    "media_player": frozenset({ATTR_MEDIA_VOLUME_LEVEL, ATTR_INPUT_SOURCE}),
+    "lock": frozenset(),
+    "input_number": frozenset(),
+    "input_select": frozenset(),
+    "input_text": frozenset(),
+    **dict.fromkeys(SIMPLE_ONOFF_DOMAINS, frozenset()),
+}
+
+# Enum members bound once for the per-entity comparisons
+_HVAC_HEAT_COOL = HVACMode.HEAT_COOL
+_LOCKED = LockState.LOCKED
+# lock states that can be restored
+_LOCK_STATES = frozenset({LockState.LOCKED, LockState.UNLOCKED})
+
+# Domains that are always called, even when already in the saved state
+ALWAYS_APPLY_DOMAINS = frozenset({"remote", "siren"})
+
+
+class CallResult(NamedTuple):
+    """Outcome of a service call that waited for a state change."""
+
+    entity_id: str
+    old_state: State | None
+    new_state: State | None
+    old_value: str | None
+    new_value: str | None
+    matched: bool
+    timeout: bool
+
 
-COMMON_LIGHT_ATTRS = {"effect", "flash", "white", "profile"}
+def _without_none(attributes) -> dict:
+    """Copy attributes without None values; they are never restored."""
+    return {key: value for key, value in attributes.items() if value is not None}
+
+
+def _light_safe_attrs(eid: str, attrs: dict) -> dict:
+    """Select the saved light attributes that light.turn_on accepts together."""
+    # ATTR_ATTRS has just these two keys; "profile" takes precedence
+    if "profile" in attrs:
+        allowed_attrs = _ATTR_ALLOWED["profile"]
+    elif "white" in attrs:
+        allowed_attrs = _ATTR_ALLOWED["white"]
+    else:
+        color_mode = attrs.get("color_mode", "color_temp")
+        allowed_attrs = _COLOR_MODE_ALLOWED.get(color_mode)
+        if allowed_attrs is None:
+            _LOGGER.warning(
+                "Unknown color_mode '%s' for %s, allowing only common attributes",
+                color_mode,
+                eid,
+            )
+            allowed_attrs = COMMON_LIGHT_ATTRS
+
+    safe_attrs = {k: attrs[k] for k in attrs.keys() & allowed_attrs}
+    if "color_temp_kelvin" in safe_attrs and "color_temp" in safe_attrs:
+        safe_attrs.pop("color_temp")
+    if "brightness" in safe_attrs and "brightness_pct" in safe_attrs:
+        safe_attrs.pop("brightness_pct")
+    return safe_attrs
+
+
+def _freeze(data: dict) -> tuple:
+    """Hashable form of flat service data; lists become tuples."""
+    return tuple(
+        sorted(
+            (key, tuple(value) if type(value) is list else value)
+            for key, value in data.items()
+        )
+    )
+
+
+def _same_value(current: Any, saved: Any) -> bool:
+    """Compare a live attribute with a stored one; JSON storage turns tuples into lists."""
+    if type(current) is tuple and type(saved) is list:
+        return list(current) == saved
+    return current == saved
+
+
+def _attrs_equal(current_attrs, attrs: dict, domain: str) -> bool:
+    """Compare the attributes that matter for domain; all saved ones if unknown."""
+    salient = SALIENT_ATTRS.get(domain)
+    keys = attrs.keys() if salient is None else attrs.keys() & salient
+    return all(
+        attrs[key] is None or _same_value(current_attrs.get(key), attrs[key])
+        for key in keys
+    )
+
+
+def _state_matches(current: State, state: str, attrs: dict, domain: str) -> bool:
+    """Return True if current already has the saved state and salient attributes."""
+    return current.state == state and _attrs_equal(current.attributes, attrs, domain)
+
+
+def _timeout_result(entity_id: str) -> CallResult:
+    """Result of a state wait that expired before a matching change was seen."""
+    return CallResult(entity_id, None, None, None, None, False, True)
+
+
+def _matched_result(state: State) -> CallResult:
+    """Result for an entity that already was in the expected state."""
+    return CallResult(
+        state.entity_id, state, state, state.state, state.state, True, False
+    )
 
 
 class ResSceneManager:
@@ -88,7 +284,117 @@ class ResSceneManager:
         self.store = store
         self.stored_data: dict[str, Any] = stored_data
         # stored_data: {scene_id: {entity_id: {"state": ..., "attributes": {...}}}}
+        # scenes saved by older versions may still hold None attribute values
+        for scene in stored_data.values():
+            for eid, info in (scene or {}).items():
+                if eid != "_options" and isinstance(info, dict):
+                    attributes = info.get("attributes")
+                    if attributes and None in attributes.values():
+                        info["attributes"] = _without_none(attributes)
         self._user_options: dict[str, Any] = {}
+        self._sorted_scene_ids: list[str] | None = None
+        # domain -> apply_state() handler, called as
+        # handler(eid, saved state, attrs, options, current State)
+        self._handlers = {
+            "light": self._apply_light,
+            "cover": self._apply_cover,
+            "climate": self._apply_climate,
+            "media_player": self._apply_media_player,
+            "lock": self._apply_lock,
+            "input_number": self._apply_input_number,
+            "input_select": self._apply_input_select,
+            "input_text": self._apply_input_text,
+            # the on/off handler is bound to its domain up front
+            **{
+                domain: partial(self._apply_onoff, domain)
+                for domain in SIMPLE_ONOFF_DOMAINS
+            },
+        }
+        # scene_id -> pretty JSON of the scene; dropped whenever it changes
+        self._json_cache: dict[str, str] = {}
+        # True while a debounced storage write is scheduled
+        self._save_pending = False
+        # entity_id -> lock serializing service calls on that entity; weak so
+        # a lock disappears once no call holds or waits for it
+        self._entity_locks: WeakValueDictionary[str, asyncio.Lock] = (
+            WeakValueDictionary()
+        )
+        # entity_id -> loop time of the last call, tracked with call_interval
+        self._last_calls: dict[str, float] = {}
+        # entity_id -> pending (future, expected) waiters for state changes
+        self._waiters: dict[str, list[tuple[asyncio.Future, str | None]]] = {}
+        # entity_id -> remover of the shared state listener routing to waiters
+        self._state_listeners: dict[str, CALLBACK_TYPE] = {}
+
+    @callback
+    def _route_state_change(self, event: Event[EventStateChangedData]):
+        """Resolve the waiters of the changed entity whose expected state is met."""
+        entity_id = event.data["entity_id"]
+        waiters = self._waiters.get(entity_id)
+        if not waiters:
+            return
+
+        new_state = event.data.get("new_state")
+        old_state = event.data.get("old_state")
+        new_value = new_state.state if new_state else None
+        old_value = old_state.state if old_state else None
+
+        remaining = []
+        for waiter in waiters:
+            future, expected = waiter
+            if future.done():
+                continue
+            # wait until matched state to expected
+            if expected is not None and new_value != expected:
+                remaining.append(waiter)
+                continue
+            future.set_result(
+                CallResult(
+                    entity_id, old_state, new_state, old_value, new_value, True, False
+                )
+            )
+        if remaining:
+            self._waiters[entity_id] = remaining
+            return
+
+        # everyone was served: stop listening now instead of routing further
+        # changes until the waiting coroutines get to _remove_waiter()
+        del self._waiters[entity_id]
+        if remove_listener := self._state_listeners.pop(entity_id, None):
+            remove_listener()
+
+    @callback
+    def _add_waiter(self, entity_id: str, expected: str | None) -> asyncio.Future:
+        """Register a waiter for the next matching state change of entity_id."""
+        future: asyncio.Future = self.hass.loop.create_future()
+        self._waiters.setdefault(entity_id, []).append((future, expected))
+
+        # one listener per observed entity, shared by all of its waiters
+        if entity_id not in self._state_listeners:
+            # the router is a @callback: run it inline, no call_soon hop
+            self._state_listeners[entity_id] = async_track_state_change_event(
+                self.hass,
+                [entity_id],
+                self._route_state_change,
+                job_type=HassJobType.Callback,
+            )
+        return future
+
+    @callback
+    def _remove_waiter(self, entity_id: str, future: asyncio.Future):
+        """Drop a waiter and release the entity listener once nobody waits."""
+        waiters = self._waiters.get(entity_id)
+        if waiters is None:
+            return
+
+        remaining = [waiter for waiter in waiters if waiter[0] is not future]
+        if remaining:
+            self._waiters[entity_id] = remaining
+            return
+
+        del self._waiters[entity_id]
+        if remove_listener := self._state_listeners.pop(entity_id, None):
+            remove_listener()
 
     async def async_call_and_wait_state(
         self,
@@ -98,13 +404,14 @@ class ResSceneManager:
         service_data: dict | None = None,
         timeout: float = ACTION_TIMEOUT_DEFAULT,
         expected: str | None = None,
-    ):
+    ) -> CallResult:
         """
         Call a service and wait for entity state change.
 
         Note: Captures any state change on entity_id, regardless of source.
         Callers must serialize operations on the same entity to avoid
         attributing state changes from concurrent operations.
+        All waits on the same entity share a single state listener.
 
         Args:
             entity_id: Target entity to observe
@@ -112,79 +419,118 @@ class ResSceneManager:
             service: Service name (e.g. 'turn_on')
             service_data: Dict passed to hass.services.async_call()
             timeout: Max seconds to wait
-            expected: If provided, wait until state == expected
+            expected: If provided, wait until state == expected; if the entity
+                is already in that state, no state change will follow, so the
+                call is made blocking and returns once the service handled it
+                or timeout expired
 
         Returns:
-            dict: {
-                "entity_id": str,
-                "old_state": State | None,
-                "new_state": State | None,
-                "old_value": str | None,
-                "new_value": str | None,
-                "matched": bool,
-                "timeout": bool,
-            }
+            CallResult: entity_id, old_state, new_state, old_value, new_value,
+            matched (the expected state was observed) and timeout (the wait expired).
         """
-        hass = self.hass
-
-        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        target = {ATTR_ENTITY_ID: entity_id}
+        if expected is not None:
+            current = self.hass.states.get(entity_id)
+            if current is not None and current.state == expected:
+                # no state change will follow, but the call may still change
+                # attributes: block until it is handled so that calls made
+                # after this one cannot overtake it; blocking calls have no
+                # time limit of their own, so bound them like the wait
+                try:
+                    async with asyncio.timeout(timeout):
+                        await self.hass.services.async_call(
+                            domain,
+                            service,
+                            service_data or {},
+                            target=target,
+                            blocking=True,
+                        )
+                except TimeoutError:
+                    return _timeout_result(entity_id)
+                return _matched_result(current)
 
-        @callback
-        def _state_changed(event: Event[EventStateChangedData]):
-            new_state = event.data.get("new_state")
-            old_state = event.data.get("old_state")
-            new_value = new_state.state if new_state else None
-            old_value = old_state.state if old_state else None
+        future = self._add_waiter(entity_id, expected)
+        try:
+            # call service
+            await self.hass.services.async_call(
+                domain,
+                service,
+                service_data or {},
+                target=target,
+                blocking=False,
+            )
 
-            # wait until matched state to expected
-            if expected is not None and new_value != expected:
-                return
+            try:
+                async with asyncio.timeout(timeout):
+                    result = await future
+            except TimeoutError:
+                result = _timeout_result(entity_id)
+        finally:
+            self._remove_waiter(entity_id, future)
 
-            if not future.done():
-                future.set_result(
-                    {
-                        ATTR_ENTITY_ID: entity_id,
-                        "old_state": old_state,
-                        "new_state": new_state,
-                        "old_value": old_value,
-                        "new_value": new_value,
-                        "matched": True
-                        if expected is None
-                        else (new_value == expected),
-                        "timeout": False,
-                    }
-                )
+        return result
 
-        # regist event listener
-        remove_listener = async_track_state_change_event(
-            hass, [entity_id], _state_changed
-        )
+    async def _batch_call_and_wait(
+        self,
+        entity_ids: list[str],
+        domain: str,
+        service: str,
+        service_data: dict | None = None,
+        expected: str | None = None,
+        timeout: float = ACTION_TIMEOUT_DEFAULT,
+    ) -> dict[str, CallResult]:
+        """
+        Call one service for several entities at once and wait for each entity's state change.
 
-        # call service
-        await hass.services.async_call(
-            domain,
-            service,
-            service_data or {},
-            target={ATTR_ENTITY_ID: entity_id},
-            blocking=False,
-        )
+        Same contract as async_call_and_wait_state(), but a single service call targets all entity_ids and all waits share one timeout.
+        If any entity already is in the expected state, the call is made blocking, as async_call_and_wait_state() does for one entity.
 
+        Returns:
+            dict[str, CallResult]: Result (as returned by async_call_and_wait_state) per entity_id.
+        """
+        if not entity_ids:
+            return {}
+
+        # entities already in the expected state get no waiter
+        results = {}
+        if expected is not None:
+            get_state = self.hass.states.get
+            for eid in entity_ids:
+                current = get_state(eid)
+                if current is not None and current.state == expected:
+                    results[eid] = _matched_result(current)
+
+        futures = {
+            eid: self._add_waiter(eid, expected)
+            for eid in entity_ids
+            if eid not in results
+        }
+        # those will not change state: block so later calls cannot overtake
+        blocking = bool(results)
+        handled = False
         try:
-            result = await asyncio.wait_for(future, timeout)
-        except asyncio.TimeoutError:
-            result = {
-                ATTR_ENTITY_ID: entity_id,
-                "old_value": None,
-                "new_value": None,
-                "old_state": None,
-                "new_state": None,
-                "matched": False,
-                "timeout": True,
-            }
+            async with asyncio.timeout(timeout):
+                await self.hass.services.async_call(
+                    domain,
+                    service,
+                    service_data or {},
+                    target={ATTR_ENTITY_ID: list(entity_ids)},
+                    blocking=blocking,
+                )
+                handled = True
+                if futures:
+                    await asyncio.wait(futures.values())
+        except TimeoutError:
+            if not handled:
+                # the blocking call itself did not finish in time
+                results = {eid: _timeout_result(eid) for eid in results}
         finally:
-            remove_listener()
+            for eid, future in futures.items():
+                self._remove_waiter(eid, future)
 
-        return result
+        for eid, future in futures.items():
+            results[eid] = future.result() if future.done() else _timeout_result(eid)
+        return results
 
     async def async_run_actions_sequentially(self, actions: list[dict]):
         """
@@ -200,13 +546,12 @@ class ResSceneManager:
                 - 'timeout' (float, optional): Seconds to wait for the expected state; falls back to ACTION_TIMEOUT_DEFAULT.
 
         Returns:
-            list[dict]: A list of result dictionaries for each action. Each result contains keys such as
-            'entity_id', 'old_state', 'new_state', 'matched' (true if expected state was observed), and
-            'timeout' (true if the wait expired).
+            list[CallResult]: A CallResult for each action, with fields such as
+            entity_id, old_state, new_state, matched (true if expected state was observed), and
+            timeout (true if the wait expired).
         """
-        results = []
-        for action in actions:
-            result = await self.async_call_and_wait_state(
+        return [
+            await self.async_call_and_wait_state(
                 entity_id=action[ATTR_ENTITY_ID],
                 domain=action[ATTR_DOMAIN],
                 service=action[ATTR_SERVICE],
@@ -214,18 +559,20 @@ class ResSceneManager:
                 expected=action.get("expected"),
                 timeout=action.get("timeout", ACTION_TIMEOUT_DEFAULT),
             )
-            results.append(result)
-        return results
+            for action in actions
+        ]
 
     async def restore_scenes(self):
         """Restore saved scenes on restart (EntityRegistry creation)"""
-        for scene_id in self.stored_data.keys():
-            # await self.create_or_update_scene(scene_id)
-            async_dispatcher_send(self.hass, f"{DOMAIN}_scene_added", scene_id)
+        # one signal for the whole batch instead of one per scene
+        async_dispatcher_send(self.hass, SIGNAL_SCENE_ADDED, None)
         _LOGGER.info("Restored %s scenes", len(self.stored_data))
 
     async def save_scene(
-        self, scene_id: str, snapshot_entities: list, options: dict | None = None
+        self,
+        scene_id: str,
+        snapshot_entities: Iterable[str],
+        options: dict | None = None,
     ):
         """
         Save a snapshot of the specified entities' states and attributes under the given scene id.
@@ -234,118 +581,97 @@ class ResSceneManager:
 
         Parameters:
             scene_id (str): Identifier to store the scene under.
-            snapshot_entities (list): Iterable of entity IDs to include in the snapshot.
+            snapshot_entities (Iterable[str]): Entity IDs to include in the snapshot.
             options (dict | None): Optional scene-specific options (merged with user options). Recognized keys include:
                 - "action_timeout" (float): timeout in seconds for actions used to capture attributes.
                 - "restore_light_attributes" (bool): if true, attempt to capture full light attributes by briefly turning lights on/off.
         """
-        _options = deepcopy(self._user_options)
-        _options.update(options or {})
+        # Option values are scalars; a shallow merge is all that is needed
+        _options = {**self._user_options, **(options or {})}
         states = {}
         timeout = _options.get("action_timeout", ACTION_TIMEOUT_DEFAULT)
 
-        async def snapshot_light(eid: str, state: str):
-            """
-            Capture a light's current on-state attributes by briefly turning it on and then off to create a snapshot.
-
-            Parameters:
-                eid (str): Entity ID of the light to snapshot.
-                state (str): Original state string to record as the saved state.
-
-            Returns:
-                dict: {"state_obj": <state object>, "save_state": <state str>} containing the captured state object and the saved state string if the snapshot succeeded, or None if the snapshot failed.
-            """
-            results = await self.async_run_actions_sequentially(
-                [
-                    {
-                        ATTR_DOMAIN: "light",
-                        ATTR_SERVICE: SERVICE_TURN_ON,
-                        ATTR_ENTITY_ID: eid,
-                        ATTR_SERVICE_DATA: {"transition": 0},
-                        "expected": STATE_ON,
-                        "timeout": timeout,
-                    },
-                    {
-                        ATTR_DOMAIN: "light",
-                        ATTR_SERVICE: SERVICE_TURN_OFF,
-                        ATTR_ENTITY_ID: eid,
-                        ATTR_SERVICE_DATA: {"transition": 0},
-                        "expected": STATE_OFF,
-                        "timeout": timeout,
-                    },
-                ]
-            )
-            turn_on_result = results[0]
-            turn_off_result = results[1]
-            if turn_on_result.get("timeout") or not turn_on_result.get("matched"):
-                _LOGGER.warning(
-                    "Failed to capture light attributes for %s: turn_on %s",
-                    eid,
-                    "timed out"
-                    if turn_on_result.get("timeout")
-                    else "did not match expected state",
-                )
-                return None
-            if turn_off_result.get("timeout") or not turn_off_result.get("matched"):
-                _LOGGER.warning(
-                    "Light %s did not reach 'off' state after snapshot: %s",
-                    eid,
-                    "timed out"
-                    if turn_off_result.get("timeout")
-                    else "did not match expected state",
-                )
-            return {"state_obj": turn_on_result.get("new_state"), "save_state": state}
-
-        tasks = []
-        for eid in snapshot_entities:
-            domain = eid.split(".")[0]
-            if domain in (
-                "sensor",
-                "binary_sensor",
-                "device_tracker",
-                "camera",
-                "vacuum",
-                "scene",
-                "script",
-            ):
-                _LOGGER.warning(
-                    "Domain %s (%s) is not support in %s.", domain, eid, DOMAIN
-                )
-                continue
-
-            if state_obj := self.hass.states.get(eid):
+        # Set for O(1) membership tests; drop non-restorable domains up front
+        snapshot_set = set(snapshot_entities)
+        skipped = [
+            eid
+            for eid in snapshot_set
+            if eid.partition(".")[0] in NON_RESTORABLE_DOMAINS
+        ]
+        if skipped:
+            _LOGGER.warning("Entities not supported in %s: %s", DOMAIN, skipped)
+            snapshot_set.difference_update(skipped)
+
+        off_lights = []
+        get_state = self.hass.states.get
+        probe_off_lights = _options.get("restore_light_attributes")
+        for eid in snapshot_set:
+            if state_obj := get_state(eid):
                 if (
-                    _options.get("restore_light_attributes")
-                    and domain == "light"
+                    probe_off_lights
                     and state_obj.state == STATE_OFF
+                    and state_obj.domain == "light"
                 ):
-                    # Make async snapshot task
-                    tasks.append(snapshot_light(eid, STATE_OFF))
+                    # Snapshot later, together with the other OFF lights; the
+                    # set above already probes a repeated entity only once
+                    off_lights.append(eid)
                 else:
                     # Add what is readily available immediately
                     states[eid] = {
                         ATTR_STATE: state_obj.state,
-                        "attributes": deepcopy(state_obj.attributes),
+                        "attributes": _without_none(state_obj.attributes),
                     }
 
-        # Run in parallel and combine the results
-        if tasks:
-            results = await asyncio.gather(*tasks)
-            for result in results:
-                if result is None:
+        # Briefly turn all OFF lights on at once to capture their attributes
+        if off_lights:
+            on_results = await self._batch_call_and_wait(
+                off_lights,
+                "light",
+                SERVICE_TURN_ON,
+                {"transition": 0},
+                expected=STATE_ON,
+                timeout=timeout,
+            )
+            # Attributes are captured from the turn_on event, so saving does
+            # not wait for the lights to go back off; a background check only
+            # reports the ones that stay on.
+            off_futures = {eid: self._add_waiter(eid, STATE_OFF) for eid in off_lights}
+            try:
+                await self.hass.services.async_call(
+                    "light",
+                    SERVICE_TURN_OFF,
+                    {"transition": 0},
+                    target={ATTR_ENTITY_ID: off_lights},
+                    blocking=False,
+                )
+            except BaseException:
+                for eid, future in off_futures.items():
+                    self._remove_waiter(eid, future)
+                raise
+            self.hass.async_create_background_task(
+                self._confirm_lights_off(off_futures, timeout),
+                name=f"{DOMAIN} confirm probed lights off",
+            )
+            for eid in off_lights:
+                turn_on_result = on_results[eid]
+                if turn_on_result.timeout or not turn_on_result.matched:
+                    _LOGGER.warning(
+                        "Failed to capture light attributes for %s: turn_on %s",
+                        eid,
+                        "timed out"
+                        if turn_on_result.timeout
+                        else "did not match expected state",
+                    )
                     continue
-                state_obj = result["state_obj"]
-                save_state = result["save_state"]
-                if state_obj:
-                    eid = state_obj.entity_id
+                if state_obj := turn_on_result.new_state:
                     states[eid] = {
-                        ATTR_STATE: save_state,
-                        "attributes": deepcopy(state_obj.attributes),
+                        ATTR_STATE: STATE_OFF,
+                        "attributes": _without_none(state_obj.attributes),
                     }
 
         # Restore a saved state if the specified entity's data is unavailable
         for prev_eid, prev_state in self.stored_data.get(scene_id, {}).items():
-            if prev_eid in snapshot_entities and (
+            if prev_eid in snapshot_set and (
                 prev_eid not in states
                 or states.get(prev_eid, {}).get(ATTR_STATE) == STATE_UNAVAILABLE
             ):
@@ -355,7 +681,10 @@ class ResSceneManager:
                     STATE_UNKNOWN,
                     None,
                 ):
-                    states[prev_eid] = deepcopy(prev_state)
+                    states[prev_eid] = {
+                        ATTR_STATE: prev_state[ATTR_STATE],
+                        "attributes": dict(prev_state.get("attributes", {})),
+                    }
                     _LOGGER.info(
                         "Using fallback state for %s in scene '%s' (current state unavailable)",
                         prev_eid,
@@ -370,23 +699,104 @@ class ResSceneManager:
 
         if options is not None:
             states["_options"] = options
-        self.stored_data[scene_id] = states
-        await self.store.async_save(self.stored_data)
-        async_dispatcher_send(self.hass, f"{DOMAIN}_scene_added", scene_id)
+        # keep memory in the same JSON-native shape the store loads back
+        self.stored_data[scene_id] = to_json_safe(states)
+        self._json_cache.pop(scene_id, None)
+        self._index_scene_id(scene_id)
+        self.schedule_save()
+        async_dispatcher_send(self.hass, SIGNAL_SCENE_ADDED, scene_id)
         _LOGGER.info("Saved res scene '%s' with %s entities", scene_id, len(states))
 
+    async def _confirm_lights_off(
+        self, futures: dict[str, asyncio.Future], timeout: float
+    ):
+        """Warn about probed lights that did not turn back off within timeout."""
+        try:
+            await asyncio.wait(futures.values(), timeout=timeout)
+        finally:
+            for eid, future in futures.items():
+                self._remove_waiter(eid, future)
+
+        get_state = self.hass.states.get
+        still_on = [
+            eid
+            for eid, future in futures.items()
+            if not future.done()
+            and (state_obj := get_state(eid)) is not None
+            and state_obj.state != STATE_OFF
+        ]
+        if still_on:
+            _LOGGER.warning(
+                "Lights did not turn back off after capturing their attributes: %s",
+                still_on,
+            )
+
     async def delete_scene(self, scene_id):
         """Remove scene"""
+        if self._remove_scene_data(scene_id):
+            self.schedule_save()
+
+    @callback
+    def schedule_save(self) -> None:
+        """Schedule a debounced write of the stored scenes to storage."""
+        self._save_pending = True
+        self.store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict:
+        """Return the data for a delayed write; called by the Store when it fires."""
+        self._save_pending = False
+        return self.stored_data
+
+    async def async_flush(self) -> None:
+        """Write a pending debounced save to storage right away."""
+        if self._save_pending:
+            self._save_pending = False
+            await self.store.async_save(self.stored_data)
+
+    def _remove_scene_data(self, scene_id: str) -> bool:
+        """
+        Remove a scene from memory and notify listeners, without writing storage.
+
+        Returns:
+            bool: True if the scene existed and was removed.
+        """
+        removed = False
         # remove from stored data
         if scene_id in self.stored_data:
             del self.stored_data[scene_id]
-            await self.store.async_save(self.stored_data)
+            self._json_cache.pop(scene_id, None)
+            self._unindex_scene_id(scene_id)
+            removed = True
             _LOGGER.info("Deleted scene data %s", scene_id)
         else:
             _LOGGER.warning("Scene %s not found in store", scene_id)
 
         # dispatcher notify
-        async_dispatcher_send(self.hass, f"{DOMAIN}_scene_removed", scene_id)
+        async_dispatcher_send(self.hass, SIGNAL_SCENE_REMOVED, scene_id)
+        return removed
+
+    def _rename_scene_data(self, old_id: str, new_id: str) -> bool:
+        """
+        Rename a scene in memory and notify listeners, without writing storage.
+
+        Returns:
+            bool: True if the scene existed and was renamed.
+        """
+        if old_id not in self.stored_data or old_id == new_id:
+            return False
+
+        self.stored_data[new_id] = self.stored_data.pop(old_id)
+        self._json_cache.pop(new_id, None)
+        if (text := self._json_cache.pop(old_id, None)) is not None:
+            self._json_cache[new_id] = text
+        self._unindex_scene_id(old_id)
+        self._index_scene_id(new_id)
+        _LOGGER.info("Renamed scene %s to %s", old_id, new_id)
+
+        # dispatcher notify
+        async_dispatcher_send(self.hass, SIGNAL_SCENE_RENAMED, old_id, new_id)
+        return True
 
     async def apply_scene(self, scene_id) -> bool:
         """Apply a saved scene"""
@@ -394,139 +804,368 @@ class ResSceneManager:
             _LOGGER.warning("Scene %s not found", scene_id)
             return False
 
-        states = deepcopy(self.stored_data[scene_id] or {})
-        _options = deepcopy(self._user_options)
-        saved_options = states.pop("_options", {}) or {}
+        # apply_state() only reads the saved entries, so no deep copy is needed
+        scene = self.stored_data[scene_id] or {}
+        saved_options = scene.get("_options", {}) or {}
         if not isinstance(saved_options, dict):
             _LOGGER.warning(
                 "Ignored invalid _options for scene %s: %r",
                 scene_id,
                 saved_options,
             )
-        else:
-            _options.update(saved_options)
-
-        success = True
+            saved_options = {}
+        _options = {**self._user_options, **saved_options}
+
+        # Plain turn_on / turn_off entities, and lights turned on with the
+        # same attributes, are grouped into one call per (domain, service,
+        # service data); everything else is applied per entity.
+        restore_light_attrs = _options.get("restore_light_attributes", False)
+        groups: dict[tuple[str, str, tuple], list[str]] = {}
+        singles = {}
+        get_state = self.hass.states.get
+        for eid, info in scene.items():
+            if eid == "_options":
+                continue
+            # look each entity up once; apply_state() reuses the result
+            target_state = get_state(eid)
+            if target_state is None or target_state.state in (
+                STATE_UNAVAILABLE,
+                STATE_UNKNOWN,
+            ):
+                _LOGGER.warning("Target entity %s is unusable.", eid)
+                continue
+            domain = target_state.domain
+            state = info.get(ATTR_STATE)
+            attrs = info.get("attributes", {})
+            if (domain in SIMPLE_ONOFF_DOMAINS and state in (STATE_ON, STATE_OFF)) or (
+                domain == "light" and state == STATE_OFF and not restore_light_attrs
+            ):
+                data_key = ()
+            elif domain == "light" and state == STATE_ON:
+                # lights sharing the same color/brightness go in one call
+                try:
+                    data_key = _freeze(_light_safe_attrs(eid, attrs))
+                    hash(data_key)
+                except TypeError:
+                    singles[eid] = (info, target_state)
+                    continue
+            else:
+                singles[eid] = (info, target_state)
+                continue
 
-        async def safe_apply(eid, info):
-            nonlocal success
-            try:
-                await self.apply_state(eid, info, _options)
-            except Exception as e:  # noqa: BLE001
-                success = False
-                _LOGGER.error(
-                    "Failed to apply state for %s in scene %s: %s", eid, scene_id, e
+            if domain not in ALWAYS_APPLY_DOMAINS and _state_matches(
+                target_state, state, attrs, domain
+            ):
+                _LOGGER.debug("%s is already in the saved state, skip.", eid)
+                continue
+            service = SERVICE_TURN_ON if state == STATE_ON else SERVICE_TURN_OFF
+            groups.setdefault((domain, service, data_key), []).append(eid)
+
+        # eager tasks run up to their first await right away, so entities
+        # that apply_state() skips finish without a trip through the loop
+        results = await asyncio.gather(
+            *(
+                create_eager_task(self.apply_state(eid, info, _options, target_state))
+                for eid, (info, target_state) in singles.items()
+            ),
+            *(
+                create_eager_task(
+                    self._apply_group(
+                        domain, service, dict(data_key), entity_ids, _options
+                    )
                 )
+                for (domain, service, data_key), entity_ids in groups.items()
+            ),
+            return_exceptions=True,
+        )
 
-        await asyncio.gather(*(safe_apply(eid, info) for eid, info in states.items()))
+        # results are in the same order as the awaitables above; a cancelled
+        # task yields a CancelledError, which is not an Exception subclass
+        failures = [
+            f"{target}: {result!r}"
+            for target, result in zip([*singles, *groups.values()], results)
+            if isinstance(result, BaseException)
+        ]
+        if failures:
+            _LOGGER.warning(
+                "Scene %s applied with %s error(s): %s",
+                scene_id,
+                len(failures),
+                "; ".join(failures),
+            )
+            return False
 
-        if success:
-            _LOGGER.info("Applied scene %s successfully", scene_id)
-        else:
-            _LOGGER.warning("Scene %s applied with errors", scene_id)
-        return success
+        _LOGGER.info("Applied scene %s successfully", scene_id)
+        return True
 
-    async def apply_state(self, eid: str, info: dict, options: dict):
+    async def apply_state(
+        self, eid: str, info: dict, options: dict, target_state: State | None = None
+    ):
         """
         Restore a single entity to its saved state and attributes by invoking the appropriate Home Assistant services.
 
         Parameters:
             eid (str): The entity_id to restore (e.g., "light.kitchen").
-            info (dict): Saved scene data for the entity. Expected keys:
+            info (dict): Saved scene data for the entity; read only, never modified. Expected keys:
                 - "state": The saved state value (string).
                 - "attributes": Mapping of attribute names to saved values; attributes with value None are ignored.
             options (dict): Runtime options that affect restoration behavior. Recognized keys:
                 - "restore_light_attributes" (bool): If true, restore light attributes even when the saved state is STATE_OFF.
                 - "action_timeout" (float): Timeout in seconds used when waiting for expected state changes.
+            target_state (State | None): Current state of the entity if the caller already looked it up.
         """
-        domain = eid.split(".")[0]
         state = info.get(ATTR_STATE)
-        target = {ATTR_ENTITY_ID: eid}
-        attrs = {}
-        for _key, _value in info.get("attributes", {}).items():
-            if _value is not None:
-                attrs[_key] = _value
+        # None values are stripped when the scene is saved or loaded
+        attrs = info.get("attributes", {})
 
         if not state:
             _LOGGER.warning("Saved state is None, skip.")
             return
 
-        target_state = self.hass.states.get(eid)
+        if target_state is None:
+            target_state = self.hass.states.get(eid)
         if target_state is None or target_state.state in (
             STATE_UNAVAILABLE,
             STATE_UNKNOWN,
         ):
-            _LOGGER.warning("Target entity is unusable.")
+            _LOGGER.warning("Target entity %s is unusable.", eid)
             return
 
+        # State splits its entity_id once; reuse that instead of splitting here
+        domain = target_state.domain
+
         # skip non-restorable domains
-        if domain in (
-            "sensor",
-            "binary_sensor",
-            "device_tracker",
-            "camera",
-            "vacuum",
-            "scene",
-            "script",
-        ):
+        if domain in NON_RESTORABLE_DOMAINS:
             _LOGGER.debug("Domain %s is not restorable, skip.", domain)
             return
 
         # check state
-        if domain == "lock" and state not in ("locked", "unlocked"):
+        if domain == "lock" and state not in _LOCK_STATES:
             _LOGGER.debug("Domain %s is not restorable state %s , skip.", domain, state)
             return
 
+        # nothing to do when the entity already matches the scene
+        if domain not in ALWAYS_APPLY_DOMAINS and _state_matches(
+            target_state, state, attrs, domain
+        ):
+            _LOGGER.debug("%s is already in the saved state, skip.", eid)
+            return
+
+        handler = self._handlers.get(domain)
+        if handler is None:
+            _LOGGER.debug("Domain %s not handled, skip.", domain)
+            return
+        await handler(eid, state, attrs, options, target_state)
+
+    async def _apply_group(self, domain, service, service_data, entity_ids, options):
+        """
+        Turn a group of entities of one domain on or off with a single service call.
+
+        Parameters:
+            domain (str): Domain shared by all entities (a simple on/off domain or "light").
+            service (str): SERVICE_TURN_ON or SERVICE_TURN_OFF.
+            service_data (dict): Service data shared by the group (light attributes); may be empty.
+            entity_ids (list[str]): Entities to switch.
+            options (dict): Runtime options; "action_timeout" bounds the light wait.
+        """
+        if domain != "light":
+            # nothing follows a plain on/off call: fire it, as _apply_onoff() does
+            async with self._paced_calls(entity_ids, options):
+                await self.hass.services.async_call(
+                    domain,
+                    service,
+                    {},
+                    target={ATTR_ENTITY_ID: list(entity_ids)},
+                    blocking=False,
+                )
+            return
+
         timeout = options.get("action_timeout", ACTION_TIMEOUT_DEFAULT)
+        expected = STATE_ON if service == SERVICE_TURN_ON else STATE_OFF
+        async with self._paced_calls(entity_ids, options):
+            results = await self._batch_call_and_wait(
+                entity_ids,
+                domain,
+                service,
+                {"transition": 0, **service_data},
+                expected=expected,
+                timeout=timeout,
+            )
+        for eid, result in results.items():
+            if result.timeout or not result.matched:
+                _LOGGER.warning(
+                    "Failed to restore light %s to '%s' state: %s",
+                    eid,
+                    expected,
+                    f"timeout ({timeout}s)" if result.timeout else "state mismatch",
+                )
+
+    async def _call_service(
+        self,
+        eid,
+        service_domain,
+        service,
+        data,
+        options,
+        expected=None,
+        wait=True,
+        blocking=False,
+    ):
+        """
+        Call a Home Assistant service for one entity and wait until the entity reports a state change.
+
+        Calls to the same entity are serialized by a per-entity lock; calls to
+        different entities run freely. The last call of a sequence passes
+        wait=False: nothing follows it, so it is only fired.
+
+        Parameters:
+            eid (str): The entity_id the service acts on.
+            service_domain (str): Domain of the service to call (e.g., "light", "switch").
+            service (str): Service name within the domain (e.g., "turn_on", "set_temperature").
+            data (dict | None): Service call data payload; may be None.
+            options (dict): Runtime options; "action_timeout" caps the wait and
+                "call_interval" adds a pause before the next call to the same entity.
+            expected (str | None): If provided, wait until the state equals this value.
+            wait (bool): If False, call the service without installing a state waiter.
+            blocking (bool): With wait=False, wait for the service call itself to finish.
+        """
+        async with self._paced_calls((eid,), options):
+            if wait:
+                await self.async_call_and_wait_state(
+                    entity_id=eid,
+                    domain=service_domain,
+                    service=service,
+                    service_data=data,
+                    timeout=min(
+                        options.get("action_timeout", ACTION_TIMEOUT_DEFAULT),
+                        SERVICE_CALL_WAIT,
+                    ),
+                    expected=expected,
+                )
+            else:
+                await self._fire(eid, service_domain, service, data, options, blocking)
+
+    async def _call_services(self, eid, service_domain, calls, options, blocking=False):
+        """
+        Fire several independent service calls on one entity as a single locked batch.
 
-        # small helper for sequential calls with delay
-        async def call_service(service_domain, service, data, target):
-            """
-            Call a Home Assistant service for the given target and wait a short delay to throttle subsequent calls.
-
-            Parameters:
-                service_domain (str): Domain of the service to call (e.g., "light", "switch").
-                service (str): Service name within the domain (e.g., "turn_on", "set_temperature").
-                data (dict | None): Service call data payload; may be None.
-                target (dict | list | str | None): Target specification for the service call (entity_id(s) or target dict).
-            """
+        Parameters:
+            eid (str): The entity_id the services act on.
+            service_domain (str): Domain of the services to call.
+            calls (list[tuple[str, dict]]): (service, service data) pairs.
+            options (dict): Runtime options; a non-zero "call_interval" sends the
+                calls one at a time with that pause between them.
+            blocking (bool): Return only once every call has been handled, e.g.
+                because a dependent call follows; "action_timeout" bounds each call.
+        """
+        if not calls:
+            return
+        interval = options.get("call_interval", CALL_INTERVAL_DEFAULT)
+        async with self._paced_calls((eid,), options):
+            if not interval:
+                await asyncio.gather(
+                    *(
+                        self._fire(
+                            eid, service_domain, service, data, options, blocking
+                        )
+                        for service, data in calls
+                    )
+                )
+                return
+            # paced devices get the calls one by one, as with _call_service()
+            for i, (service, data) in enumerate(calls):
+                if i:
+                    await asyncio.sleep(interval)
+                await self._fire(eid, service_domain, service, data, options, blocking)
+
+    async def _fire(self, eid, service_domain, service, data, options, blocking=False):
+        """
+        Call a service for eid without waiting for a state change.
+
+        Home Assistant puts no time limit on blocking calls, so a blocking call
+        is given up after "action_timeout" seconds.
+        """
+        if not blocking:
             await self.hass.services.async_call(
-                service_domain, service, data, blocking=False, target=target
+                service_domain,
+                service,
+                data,
+                target={ATTR_ENTITY_ID: eid},
             )
-            await asyncio.sleep(SERVICE_CALL_DELAY)
-
-        # ---- light ----
-        if domain == "light":
-            restore_attrs = options.get("restore_light_attributes", False)
-            should_restore = (state == STATE_ON) or restore_attrs
-
-            allowed_attrs = None
-            for attr, allowed_keys in ATTR_ATTRS.items():
-                if attr in attrs:
-                    allowed_attrs = allowed_keys
-                    break
-            if allowed_attrs is None:
-                color_mode = attrs.get("color_mode", "color_temp")
-                allowed_attrs = COLOR_MODE_ATTRS.get(color_mode, set())
-                if color_mode not in COLOR_MODE_ATTRS:
-                    _LOGGER.warning(
-                        "Unknown color_mode '%s' for %s, allowing only common attributes",
-                        color_mode,
-                        eid,
-                    )
+            return
 
-            safe_attrs = {
-                k: v
-                for k, v in attrs.items()
-                if k in allowed_attrs or k in COMMON_LIGHT_ATTRS
-            }
-            if "color_temp_kelvin" in safe_attrs and "color_temp" in safe_attrs:
-                safe_attrs.pop("color_temp")
-            if "brightness" in safe_attrs and "brightness_pct" in safe_attrs:
-                safe_attrs.pop("brightness_pct")
+        timeout = options.get("action_timeout", ACTION_TIMEOUT_DEFAULT)
+        try:
+            async with asyncio.timeout(timeout):
+                await self.hass.services.async_call(
+                    service_domain,
+                    service,
+                    data,
+                    target={ATTR_ENTITY_ID: eid},
+                    blocking=True,
+                )
+        except TimeoutError:
+            _LOGGER.warning(
+                "%s.%s on %s was not handled within %ss, continuing",
+                service_domain,
+                service,
+                eid,
+                timeout,
+            )
+
+    def _entity_lock(self, eid: str) -> asyncio.Lock:
+        """Return the lock serializing service calls on eid; hold it with "async with"."""
+        lock = self._entity_locks.get(eid)
+        if lock is None:
+            lock = self._entity_locks[eid] = asyncio.Lock()
+        return lock
+
+    @asynccontextmanager
+    async def _paced_calls(
+        self, entity_ids: Iterable[str], options: dict
+    ) -> AsyncIterator[None]:
+        """
+        Hold the call locks of entity_ids while the calls inside the block are made.
 
-            if should_restore:
-                data = {ATTR_ENTITY_ID: eid, "transition": 0, **safe_attrs}
+        With a non-zero "call_interval" option, the block starts only once that
+        many seconds have passed since the last call to any of the entities, so
+        devices that drop rapid consecutive commands get a pause between calls
+        and none after the last one.
+        """
+        entity_ids = sorted(entity_ids)
+        interval = options.get("call_interval", CALL_INTERVAL_DEFAULT)
+        async with AsyncExitStack() as stack:
+            # one fixed order, so a group and a single call cannot deadlock
+            for eid in entity_ids:
+                await stack.enter_async_context(self._entity_lock(eid))
+            if interval:
+                last_calls = self._last_calls
+                last = max(
+                    (last_calls[eid] for eid in entity_ids if eid in last_calls),
+                    default=None,
+                )
+                if last is not None:
+                    delay = last + interval - self.hass.loop.time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+            try:
+                yield
+            finally:
+                if interval:
+                    now = self.hass.loop.time()
+                    for eid in entity_ids:
+                        self._last_calls[eid] = now
+
+    async def _apply_light(self, eid, state, attrs, options, current):
+        """Restore a light, including its color/brightness attributes when applicable."""
+        timeout = options.get("action_timeout", ACTION_TIMEOUT_DEFAULT)
+        restore_attrs = options.get("restore_light_attributes", False)
+        should_restore = (state == STATE_ON) or restore_attrs
+        safe_attrs = _light_safe_attrs(eid, attrs)
+
+        if should_restore:
+            data = {"transition": 0, **safe_attrs}
+            async with self._paced_calls((eid,), options):
                 result = await self.async_call_and_wait_state(
                     entity_id=eid,
                     domain="light",
@@ -535,17 +1174,16 @@ class ResSceneManager:
                     expected=STATE_ON,
                     timeout=timeout,
                 )
-                if result.get("timeout") or not result.get("matched"):
-                    _LOGGER.warning(
-                        "Failed to restore light %s to 'on' state: %s",
-                        eid,
-                        f"timeout ({timeout}s)"
-                        if result.get("timeout")
-                        else "state mismatch",
-                    )
+            if result.timeout or not result.matched:
+                _LOGGER.warning(
+                    "Failed to restore light %s to 'on' state: %s",
+                    eid,
+                    f"timeout ({timeout}s)" if result.timeout else "state mismatch",
+                )
 
-            if state == STATE_OFF:
-                data = {ATTR_ENTITY_ID: eid, "transition": 0}
+        if state == STATE_OFF:
+            data = {"transition": 0}
+            async with self._paced_calls((eid,), options):
                 result = await self.async_call_and_wait_state(
                     entity_id=eid,
                     domain="light",
@@ -554,195 +1192,286 @@ class ResSceneManager:
                     expected=STATE_OFF,
                     timeout=timeout,
                 )
-                if result.get("timeout") or not result.get("matched"):
-                    _LOGGER.warning(
-                        "Failed to restore light %s to 'off' state: %s",
-                        eid,
-                        f"timeout ({timeout}s)"
-                        if result.get("timeout")
-                        else "state mismatch",
-                    )
-
-        # ---- cover ----
-        elif domain == "cover":
-            position = attrs.get("position")
-            tilt = attrs.get("tilt_position")
-
-            if position is not None:
-                await call_service(
-                    "cover",
-                    SERVICE_SET_COVER_POSITION,
-                    {ATTR_ENTITY_ID: eid, "position": position},
-                    target,
-                )
-            if tilt is not None:
-                await call_service(
-                    "cover",
-                    SERVICE_SET_COVER_TILT_POSITION,
-                    {ATTR_ENTITY_ID: eid, "tilt_position": tilt},
-                    target,
+            if result.timeout or not result.matched:
+                _LOGGER.warning(
+                    "Failed to restore light %s to 'off' state: %s",
+                    eid,
+                    f"timeout ({timeout}s)" if result.timeout else "state mismatch",
                 )
 
-            if position is None and tilt is None:
-                if state == STATE_OPEN:
-                    service = SERVICE_OPEN_COVER
-                elif state == STATE_CLOSED:
-                    service = SERVICE_CLOSE_COVER
-                else:
-                    service = (
-                        SERVICE_OPEN_COVER if state == STATE_ON else SERVICE_CLOSE_COVER
-                    )
-                await call_service("cover", service, {ATTR_ENTITY_ID: eid}, target)
+    async def _apply_cover(self, eid, state, attrs, options, current):
+        """Restore a cover by position/tilt, or by open/close when no position is saved."""
+        position = attrs.get("position")
+        tilt = attrs.get("tilt_position")
+
+        if position is not None:
+            await self._call_service(
+                eid,
+                "cover",
+                SERVICE_SET_COVER_POSITION,
+                {"position": position},
+                options,
+                wait=tilt is not None,
+            )
+        if tilt is not None:
+            await self._call_service(
+                eid,
+                "cover",
+                SERVICE_SET_COVER_TILT_POSITION,
+                {"tilt_position": tilt},
+                options,
+                wait=False,
+            )
 
-        # ---- climate ----
-        elif domain == "climate":
-            hvac_mode = state if state not in (None, "") else None
+        if position is None and tilt is None:
+            if state == STATE_OPEN:
+                service = SERVICE_OPEN_COVER
+            elif state == STATE_CLOSED:
+                service = SERVICE_CLOSE_COVER
+            else:
+                service = (
+                    SERVICE_OPEN_COVER if state == STATE_ON else SERVICE_CLOSE_COVER
+                )
+            await self._call_service(eid, "cover", service, None, options, wait=False)
 
-            if hvac_mode:
-                data = {
-                    ATTR_ENTITY_ID: eid,
-                    ATTR_HVAC_MODE: hvac_mode,
-                }
-                if (
-                    hvac_mode == HVACMode.HEAT_COOL
-                    and ATTR_TARGET_TEMP_LOW in attrs
-                    and ATTR_TARGET_TEMP_HIGH in attrs
-                ):
-                    data.update(
-                        {
-                            ATTR_TARGET_TEMP_LOW: attrs[ATTR_TARGET_TEMP_LOW],
-                            ATTR_TARGET_TEMP_HIGH: attrs[ATTR_TARGET_TEMP_HIGH],
-                        }
-                    )
-                    await call_service("climate", SERVICE_SET_TEMPERATURE, data, target)
-                elif ATTR_TEMPERATURE in attrs:
-                    data.update({ATTR_TEMPERATURE: attrs[ATTR_TEMPERATURE]})
-                    await call_service("climate", SERVICE_SET_TEMPERATURE, data, target)
+    async def _apply_climate(self, eid, state, attrs, options, current):
+        """Restore a climate entity's HVAC mode, setpoints and sub-attributes."""
+        hvac_mode = state if state not in (None, "") else None
 
-                # 3. other sub-attributes
-                for key in [
+        if hvac_mode:
+            # sub-attributes to set after the mode; the preset goes last
+            sub_keys = [
+                key
+                for key in (
                     ATTR_FAN_MODE,
                     ATTR_SWING_MODE,
-                    ATTR_PRESET_MODE,
                     ATTR_HUMIDITY,
-                ]:
-                    if key in attrs:
-                        svc = f"set_{key}"
-                        await call_service(
-                            "climate",
-                            svc,
-                            {ATTR_ENTITY_ID: eid, key: attrs[key]},
-                            target,
-                        )
-
-        # ---- media_player ----
-        elif domain == "media_player":
-            if state == STATE_ON:
-                service = SERVICE_TURN_ON
-            elif state == STATE_OFF:
-                service = SERVICE_TURN_OFF
-            elif state == STATE_PLAYING:
-                service = SERVICE_MEDIA_PLAY
-            elif state == STATE_PAUSED:
-                service = SERVICE_MEDIA_PAUSE
-            elif state == STATE_IDLE:
-                service = SERVICE_MEDIA_STOP
-            else:
-                _LOGGER.warning("Unknown media_player state: %s", state)
-                return
-            await call_service(domain, service, {ATTR_ENTITY_ID: eid}, target)
-
-            if ATTR_MEDIA_VOLUME_LEVEL in attrs:
-                await call_service(
-                    domain,
-                    SERVICE_VOLUME_SET,
+                )
+                if key in attrs
+            ]
+            has_preset = ATTR_PRESET_MODE in attrs
+            data = {
+                ATTR_HVAC_MODE: hvac_mode,
+            }
+            if (
+                hvac_mode == _HVAC_HEAT_COOL
+                and ATTR_TARGET_TEMP_LOW in attrs
+                and ATTR_TARGET_TEMP_HIGH in attrs
+            ):
+                data.update(
                     {
-                        ATTR_ENTITY_ID: eid,
-                        ATTR_MEDIA_VOLUME_LEVEL: attrs[ATTR_MEDIA_VOLUME_LEVEL],
-                    },
-                    target,
+                        ATTR_TARGET_TEMP_LOW: attrs[ATTR_TARGET_TEMP_LOW],
+                        ATTR_TARGET_TEMP_HIGH: attrs[ATTR_TARGET_TEMP_HIGH],
+                    }
                 )
-            if ATTR_INPUT_SOURCE in attrs:
-                await call_service(
-                    domain,
-                    SERVICE_SELECT_SOURCE,
-                    {ATTR_ENTITY_ID: eid, ATTR_INPUT_SOURCE: attrs[ATTR_INPUT_SOURCE]},
-                    target,
+                await self._call_service(
+                    eid,
+                    "climate",
+                    SERVICE_SET_TEMPERATURE,
+                    data,
+                    options,
+                    expected=hvac_mode,
+                    wait=bool(sub_keys) or has_preset,
+                )
+            elif ATTR_TEMPERATURE in attrs:
+                data.update({ATTR_TEMPERATURE: attrs[ATTR_TEMPERATURE]})
+                await self._call_service(
+                    eid,
+                    "climate",
+                    SERVICE_SET_TEMPERATURE,
+                    data,
+                    options,
+                    expected=hvac_mode,
+                    wait=bool(sub_keys) or has_preset,
                 )
 
-        # ---- lock ----
-        elif domain == "lock":
-            service = SERVICE_LOCK if state == LockState.LOCKED else SERVICE_UNLOCK
-            data = {"entity_id": eid}
-            await call_service(domain, service, data, target)
-
-        # ---- simple on/off domains ----
-        elif domain in (
-            "fan",
-            "humidifier",
-            "remote",
-            "siren",
-            "switch",
-            "input_boolean",
-        ):
-            service = SERVICE_TURN_ON if state == STATE_ON else SERVICE_TURN_OFF
-            await call_service(domain, service, {ATTR_ENTITY_ID: eid}, target)
-
-        # ---- input_number ----
-        elif domain == "input_number":
-            try:
-                value = float(state)
-            except (ValueError, TypeError):
-                _LOGGER.warning("Invalid input_number state for %s: %r", eid, state)
-                return
-            await call_service(
-                "input_number",
-                "set_value",
-                {ATTR_ENTITY_ID: eid, "value": value},
-                target,
+            # 3. fan, swing and humidity are independent of each other
+            await self._call_services(
+                eid,
+                "climate",
+                [(f"set_{key}", {key: attrs[key]}) for key in sub_keys],
+                options,
+                blocking=has_preset,
             )
 
-        # ---- input_select ----
-        elif domain == "input_select":
-            await call_service(
-                "input_select",
-                SERVICE_SELECT_OPTION,
-                {ATTR_ENTITY_ID: eid, "option": state},
-                target,
-            )
+            # 4. many thermostats reset fan mode and setpoints when a preset
+            # is applied, so it is sent once the other calls are handled
+            if has_preset:
+                await self._call_service(
+                    eid,
+                    "climate",
+                    f"set_{ATTR_PRESET_MODE}",
+                    {ATTR_PRESET_MODE: attrs[ATTR_PRESET_MODE]},
+                    options,
+                    wait=False,
+                )
+
+    async def _apply_media_player(self, eid, state, attrs, options, current):
+        """Restore a media player's playback state, volume and source."""
+        domain = "media_player"
+        if state == STATE_ON:
+            service = SERVICE_TURN_ON
+        elif state == STATE_OFF:
+            service = SERVICE_TURN_OFF
+        elif state == STATE_PLAYING:
+            service = SERVICE_MEDIA_PLAY
+        elif state == STATE_PAUSED:
+            service = SERVICE_MEDIA_PAUSE
+        elif state == STATE_IDLE:
+            service = SERVICE_MEDIA_STOP
+        else:
+            _LOGGER.warning("Unknown media_player state: %s", state)
+            return
+        has_volume = ATTR_MEDIA_VOLUME_LEVEL in attrs
+        has_source = ATTR_INPUT_SOURCE in attrs
+        expected = MEDIA_EXPECTED_STATES.get(service)
+        if expected is None:
+            # turn_on/media_stop end in a device-specific state; a player that
+            # already is in the saved state will not change, so don't wait
+            if current.state == state:
+                expected = state
+        await self._call_service(
+            eid,
+            domain,
+            service,
+            None,
+            options,
+            expected=expected,
+            wait=has_volume or has_source,
+        )
 
-        # ---- input_text ----
-        elif domain == "input_text":
-            await call_service(
-                "input_text", "set_value", {ATTR_ENTITY_ID: eid, "value": state}, target
+        # volume and source are independent of each other
+        sub_calls = []
+        if has_volume:
+            sub_calls.append(
+                (
+                    SERVICE_VOLUME_SET,
+                    {ATTR_MEDIA_VOLUME_LEVEL: attrs[ATTR_MEDIA_VOLUME_LEVEL]},
+                )
+            )
+        if has_source:
+            sub_calls.append(
+                (SERVICE_SELECT_SOURCE, {ATTR_INPUT_SOURCE: attrs[ATTR_INPUT_SOURCE]})
             )
+        await self._call_services(eid, domain, sub_calls, options)
 
-        else:
-            _LOGGER.debug("Domain %s not handled, skip.", domain)
+    async def _apply_lock(self, eid, state, attrs, options, current):
+        """Lock or unlock."""
+        service = SERVICE_LOCK if state == _LOCKED else SERVICE_UNLOCK
+        await self._call_service(eid, "lock", service, None, options, wait=False)
 
-    def get_scene(self, scene_id: str):
+    async def _apply_onoff(self, domain, eid, state, attrs, options, current):
+        """Turn a simple on/off entity of domain on or off."""
+        service = SERVICE_TURN_ON if state == STATE_ON else SERVICE_TURN_OFF
+        await self._call_service(eid, domain, service, None, options, wait=False)
+
+    async def _apply_input_number(self, eid, state, attrs, options, current):
+        """Set an input_number to its saved value."""
+        try:
+            value = float(state)
+        except (ValueError, TypeError):
+            _LOGGER.warning("Invalid input_number state for %s: %r", eid, state)
+            return
+        await self._call_service(
+            eid,
+            "input_number",
+            "set_value",
+            {"value": value},
+            options,
+            wait=False,
+            blocking=True,
+        )
+
+    async def _apply_input_select(self, eid, state, attrs, options, current):
+        """Select the saved input_select option."""
+        await self._call_service(
+            eid,
+            "input_select",
+            SERVICE_SELECT_OPTION,
+            {"option": state},
+            options,
+            wait=False,
+            blocking=True,
+        )
+
+    async def _apply_input_text(self, eid, state, attrs, options, current):
+        """Set an input_text to its saved value."""
+        await self._call_service(
+            eid,
+            "input_text",
+            "set_value",
+            {"value": state},
+            options,
+            wait=False,
+            blocking=True,
+        )
+
+    def get_scene(self, scene_id: str) -> MappingProxyType | None:
         """
         Retrieve stored data for a scene by its identifier.
 
         Returns:
-            The scene data dictionary if found, otherwise None.
+            A read-only view of the scene data if found, otherwise None.
         """
-        return self.stored_data.get(scene_id)
+        data = self.stored_data.get(scene_id)
+        return MappingProxyType(data) if data is not None else None
+
+    def get_scene_json(self, scene_id: str) -> str:
+        """
+        Return the scene data as indented JSON text, or "{}" if the scene does not exist.
+
+        The text is cached until the scene is saved, renamed or deleted.
+        """
+        text = self._json_cache.get(scene_id)
+        if text is None:
+            data = self.stored_data.get(scene_id)
+            if data is None:
+                return "{}"
+            text = self._json_cache[scene_id] = to_pretty_json(data)
+        return text
+
+    def get_sorted_scene_ids(self) -> list[str]:
+        """
+        Return the stored scene IDs in sorted order.
+
+        The sorted list is cached until the set of scenes changes; callers must not mutate it.
+        """
+        if self._sorted_scene_ids is None:
+            self._sorted_scene_ids = sorted(self.stored_data)
+        return self._sorted_scene_ids
+
+    def _index_scene_id(self, scene_id: str):
+        """Insert scene_id into the cached sorted list, keeping it ordered."""
+        sorted_ids = self._sorted_scene_ids
+        if sorted_ids is None:
+            return
+        idx = bisect.bisect_left(sorted_ids, scene_id)
+        if idx == len(sorted_ids) or sorted_ids[idx] != scene_id:
+            sorted_ids.insert(idx, scene_id)
+
+    def _unindex_scene_id(self, scene_id: str):
+        """Remove scene_id from the cached sorted list, if present."""
+        sorted_ids = self._sorted_scene_ids
+        if sorted_ids is None:
+            return
+        idx = bisect.bisect_left(sorted_ids, scene_id)
+        if idx < len(sorted_ids) and sorted_ids[idx] == scene_id:
+            del sorted_ids[idx]
 
     def set_user_options(self, user_options: dict):
         """
-        Store a deep copy of per-user scene restoration options.
+        Store a copy of per-user scene restoration options.
 
         Parameters:
-            user_options (dict): Mapping of user-specific option keys to values; the input is deep-copied and replaces the manager's current user options.
+            user_options (dict): Mapping of user-specific option keys to values; the input is copied and replaces the manager's current user options.
         """
-        self._user_options = deepcopy(user_options)
+        self._user_options = dict(user_options)
 
-    def get_user_options(self):
+    def get_user_options(self) -> MappingProxyType:
         """
-        Return a deep copy of the currently stored per-user scene options.
+        Return a read-only view of the currently stored per-user scene options.
 
         Returns:
-            dict: A deep copy of the internal user options mapping.
+            MappingProxyType: Live, read-only view of the internal user options mapping.
         """
-        return deepcopy(self._user_options)
+        return MappingProxyType(self._user_options)
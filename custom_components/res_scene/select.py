@@ -1,14 +1,22 @@
-import json
 import logging
 
 from homeassistant.components.select import SelectEntity
+from homeassistant.core import callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
-from .const import DOMAIN
-from .helpers import to_json_safe
+from .const import (
+    DOMAIN,
+    SIGNAL_SCENE_ADDED,
+    SIGNAL_SCENE_REMOVED,
+    SIGNAL_SCENE_RENAMED,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Seconds to collect scene signals before the selectors are refreshed
+UPDATE_COOLDOWN = 0.1
+
 
 async def async_setup_entry(hass, entry, async_add_entities):
     manager = hass.data[DOMAIN]["manager"]
@@ -17,20 +25,27 @@ async def async_setup_entry(hass, entry, async_add_entities):
     selectors.append(ResSceneSelector(hass, manager, False))
     async_add_entities(selectors)
 
-    async def scene_update(_):
+    @callback
+    def refresh_options():
         for selector in selectors:
-            await selector.async_update_options()
+            selector.async_update_options()
 
-    async_dispatcher_connect(
-        hass,
-        f"{DOMAIN}_scene_added",
-        scene_update,
-    )
-    async_dispatcher_connect(
+    # a burst of scene signals rebuilds the option lists once
+    debouncer = Debouncer(
         hass,
-        f"{DOMAIN}_scene_removed",
-        scene_update,
+        _LOGGER,
+        cooldown=UPDATE_COOLDOWN,
+        immediate=False,
+        function=refresh_options,
     )
+    entry.async_on_unload(debouncer.async_shutdown)
+
+    @callback
+    def scene_update(*_):
+        debouncer.async_schedule_call()
+
+    for signal in (SIGNAL_SCENE_ADDED, SIGNAL_SCENE_REMOVED, SIGNAL_SCENE_RENAMED):
+        entry.async_on_unload(async_dispatcher_connect(hass, signal, scene_update))
 
     return True
 
@@ -52,7 +67,8 @@ class ResSceneSelector(SelectEntity):
     def extra_state_attributes(self):
         return self._attr_extra_state_attributes
 
-    async def async_update_options(self):
+    @callback
+    def async_update_options(self):
         """Refresh the list of scenes."""
         scenes = (["Apply scene"] if self._do_apply else []) + list(
             self.manager.stored_data.keys()
@@ -62,7 +78,9 @@ class ResSceneSelector(SelectEntity):
         # Set current selection if needed
         if scenes and (self._attr_current_option not in scenes):
             self._attr_current_option = scenes[0]
-            await self.async_select_option(self._attr_current_option)
+            # the apply selector falls back to "Apply scene", which applies nothing
+            if not self._do_apply:
+                self._update_json(scenes[0])
         elif not scenes:
             self._attr_current_option = None
 
@@ -77,10 +95,10 @@ class ResSceneSelector(SelectEntity):
                 await self.manager.apply_scene(option)
                 self.async_write_ha_state()
         else:
-            pretty = json.dumps(
-                to_json_safe(self.manager.stored_data.get(option, {})),
-                ensure_ascii=False,
-                indent=2,
-            )
-            self._attr_extra_state_attributes["json"] = pretty
+            self._update_json(option)
             self.async_write_ha_state()
+
+    @callback
+    def _update_json(self, option: str):
+        """Expose the JSON of the selected scene."""
+        self._attr_extra_state_attributes["json"] = self.manager.get_scene_json(option)
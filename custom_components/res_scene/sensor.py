@@ -1,11 +1,14 @@
-import json
-
-from homeassistant.core import Event, EventStateChangedData, HomeAssistant
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.event import async_track_state_change_event
 
-from .const import DOMAIN
+from .const import (
+    DOMAIN,
+    SIGNAL_SCENE_ADDED,
+    SIGNAL_SCENE_REMOVED,
+    SIGNAL_SCENE_RENAMED,
+)
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
@@ -41,7 +44,8 @@ class ResSceneAttributesSensor(Entity):
             self.hass, self.selector_entity_id, self._select_changed
         )
 
-    async def _select_changed(self, event: Event[EventStateChangedData]):
+    @callback
+    def _select_changed(self, event: Event[EventStateChangedData]):
         """Called when select entity changes."""
         entity = self.hass.states.get(self.selector_entity_id)
         if not entity:
@@ -53,14 +57,10 @@ class ResSceneAttributesSensor(Entity):
                 "rawdata": self.manager.stored_data.get(self._attr_state, {})
             }
 
-            pretty = json.dumps(
-                self._attr_extra_state_attributes["rawdata"],
-                ensure_ascii=False,
-                indent=2,
+            self._attr_extra_state_attributes["json"] = self.manager.get_scene_json(
+                self._attr_state
             )
 
-            self._attr_extra_state_attributes["json"] = pretty
-
         self.async_write_ha_state()
 
     @property
@@ -112,12 +112,17 @@ class ResSceneListSensor(Entity):
         """Register a callback to update the sensor when scene list changes."""
         # self.manager.register_scene_change_callback(self.async_update_sensor)
         async_dispatcher_connect(
-            self.hass, f"{DOMAIN}_scene_added", self.async_update_sensor
+            self.hass, SIGNAL_SCENE_ADDED, self.async_update_sensor
+        )
+        async_dispatcher_connect(
+            self.hass, SIGNAL_SCENE_REMOVED, self.async_update_sensor
         )
+        # a rename sends only this signal, with the old and the new scene_id
         async_dispatcher_connect(
-            self.hass, f"{DOMAIN}_scene_removed", self.async_update_sensor
+            self.hass, SIGNAL_SCENE_RENAMED, self.async_update_sensor
         )
 
-    async def async_update_sensor(self, scene_id):
+    @callback
+    def async_update_sensor(self, *_):
         """Update HA state to reflect current scene list."""
         self.async_write_ha_state()